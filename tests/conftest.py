@@ -61,9 +61,9 @@ class MockPersonOrganizationRole:
     role: str = "member"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Create a mock config object."""
+    """Create a mock config object shared by the whole session; tests must not mutate it."""
     config = MagicMock()
     config.POSTGRES_HOST = "localhost"
     config.POSTGRES_PORT = "5432"
@@ -1,14 +1,83 @@
 """
 Unit tests for common/services/auth.py
 """
-import time
 import jwt
 import pytest
-from unittest.mock import MagicMock, patch, call
+from operator import attrgetter
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch, call
+from common.services import auth as auth_module
+from common.models import login_method as login_method_module
 from common.services.auth import AuthService
-from common.models import Person, Email, LoginMethod, Organization, PersonOrganizationRole
-from common.models.login_method import LoginMethodType
+from common.models import Person, Email
 from common.helpers.exceptions import InputValidationError, APIException
+from common.helpers.string_utils import urlsafe_base64_encode, force_bytes
+
+
+CONFIG = SimpleNamespace(
+    QUEUE_NAME_PREFIX="test_",
+    EMAIL_SERVICE_PROCESSOR_QUEUE_NAME="email_queue",
+    VUE_APP_URI="http://localhost:3000",
+    RESET_TOKEN_EXPIRE="3600",
+    DEFAULT_USER_PASSWORD="DefaultPass123!",  # NOSONAR - Test data
+)
+
+EMAIL_OBJ = Email(entity_id="email-123", person_id="person-123", email="test@example.com")
+LOGIN_METHOD_OBJ = SimpleNamespace(entity_id="login-123", person_id="person-123", email_id="email-123",
+                                   password="hashed_password", is_oauth_method=False)
+VERIFIED_EMAIL_OBJ = Email(entity_id="email-123", person_id="person-123", email="test@example.com", is_verified=True)
+PERSON_OBJ = Person(entity_id="person-123", first_name="John", last_name="Doe")
+OAUTH_LOGIN_METHOD_OBJ = SimpleNamespace(is_oauth_method=True)
+
+RESET_TOKEN_PAYLOAD = {'email': 'test@example.com', 'email_id': 'email-123', 'person_id': 'person-123', 'exp': 2**40}
+VALID_RESET_TOKEN = jwt.encode(RESET_TOKEN_PAYLOAD, "old_hashed_password", algorithm='HS256')
+EXPIRED_RESET_TOKEN = jwt.encode({**RESET_TOKEN_PAYLOAD, 'exp': 1}, "old_hashed_password", algorithm='HS256')
+UIDB64 = urlsafe_base64_encode(force_bytes("login-123"))
+
+OAUTH_ARGS = ("test@example.com", "John", "Doe", "google", {"sub": "123"})
+
+AUTH_PATCHES = ('PersonService', 'EmailService', 'LoginMethodService', 'OrganizationService',
+                'PersonOrganizationRoleService', 'MessageSender')
+
+
+def _stub(service, returns):
+    """Set the return value of each dotted method path on the given service."""
+    for path, value in returns.items():
+        attrgetter(path)(service).return_value = value
+
+
+@pytest.fixture(scope='module', autouse=True)
+def fast_password_hash():
+    """Swap LoginMethod's scrypt hashing for a cheap stand-in; no test inspects the hash."""
+    with patch.object(login_method_module, 'generate_password_hash',
+                      side_effect=lambda password, **_: f"hashed:{password}"):
+        yield
+
+
+@pytest.fixture(scope='module')
+def auth_service():
+    """Create one AuthService for the module with its collaborators patched."""
+    with patch.multiple(auth_module, new_callable=Mock, **dict.fromkeys(AUTH_PATCHES, DEFAULT)):
+        yield AuthService(CONFIG)
+
+
+@pytest.fixture
+def auth_helpers():
+    """Patch the password check and access token helpers used by the login flows."""
+    with patch.multiple(auth_module, check_password_hash=DEFAULT, generate_access_token=DEFAULT) as mocks:
+        mocks['check_password_hash'].return_value = True
+        mocks['generate_access_token'].return_value = ("access_token", 1234567890)
+        yield SimpleNamespace(**mocks)
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_service(auth_service):
+    """Clear return values and recorded calls on the shared collaborators after each test."""
+    yield
+    for dependency in (auth_service.person_service, auth_service.email_service,
+                       auth_service.login_method_service, auth_service.organization_service,
+                       auth_service.person_organization_role_service, auth_service.message_sender):
+        dependency.reset_mock(return_value=True, side_effect=True)
 
 
 class TestAuthServiceInitialization:
@@ -16,153 +85,66 @@ class TestAuthServiceInitialization:
 
     def test_init_creates_all_services(self, mock_config):
         """Test that __init__ creates all required service instances."""
-        with patch('common.services.auth.PersonService'), \
-             patch('common.services.auth.EmailService'), \
-             patch('common.services.auth.LoginMethodService'), \
-             patch('common.services.auth.OrganizationService'), \
-             patch('common.services.auth.PersonOrganizationRoleService'), \
-             patch('common.services.auth.MessageSender'):
-
+        with patch.multiple(auth_module, new_callable=Mock, **dict.fromkeys(AUTH_PATCHES, DEFAULT)) as mocks:
             auth_service = AuthService(mock_config)
 
-            assert auth_service.config == mock_config
-            assert auth_service.person_service is not None
-            assert auth_service.email_service is not None
-            assert auth_service.login_method_service is not None
-            assert auth_service.organization_service is not None
-            assert auth_service.person_organization_role_service is not None
-            assert auth_service.message_sender is not None
+        assert auth_service.config is mock_config
+        assert auth_service.person_service is mocks['PersonService'].return_value
+        assert auth_service.email_service is mocks['EmailService'].return_value
+        assert auth_service.login_method_service is mocks['LoginMethodService'].return_value
+        assert auth_service.organization_service is mocks['OrganizationService'].return_value
+        assert auth_service.person_organization_role_service is mocks['PersonOrganizationRoleService'].return_value
+        assert auth_service.message_sender is mocks['MessageSender'].return_value
 
 
 class TestSignup:
     """Tests for signup method."""
 
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_signup_success(self, mock_person_service_class, mock_email_service_class,
-                           mock_login_method_service_class, mock_org_service_class,
-                           mock_por_service_class, mock_message_sender_class, mock_config):
+    def test_signup_success(self, auth_service):
         """Test successful user signup."""
-        # Setup mocks
-        mock_email_service = mock_email_service_class.return_value
-        mock_email_service.get_email_by_email_address.return_value = None
-        mock_email_service.save_email.return_value = MagicMock(email="test@example.com", entity_id="email-123")
-
-        mock_person_service = mock_person_service_class.return_value
-        mock_person_service.save_person.return_value = MagicMock(entity_id="person-123", first_name="John", last_name="Doe")
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method_service.save_login_method.return_value = MagicMock(entity_id="login-123")
-
-        auth_service = AuthService(mock_config)
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': None,
+            'email_service.save_email': EMAIL_OBJ,
+            'person_service.save_person': PERSON_OBJ,
+            'login_method_service.save_login_method': LOGIN_METHOD_OBJ,
+        })
 
         # Execute
         auth_service.signup("test@example.com", "John", "Doe")
 
         # Verify
-        mock_email_service.get_email_by_email_address.assert_called_once_with("test@example.com")
-        mock_email_service.save_email.assert_called_once()
-        mock_person_service.save_person.assert_called_once()
-        mock_login_method_service.save_login_method.assert_called_once()
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_signup_with_existing_email(self, mock_person_service_class, mock_email_service_class,
-                                       mock_login_method_service_class, mock_org_service_class,
-                                       mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test signup with already registered email."""
-        # Setup mocks
-        mock_email_service = mock_email_service_class.return_value
-        existing_email = MagicMock(entity_id="email-123", email="test@example.com")
-        mock_email_service.get_email_by_email_address.return_value = existing_email
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method = MagicMock()
-        mock_login_method.is_oauth_method = False
-        mock_login_method_service.get_login_method_by_email_id.return_value = mock_login_method
-
-        auth_service = AuthService(mock_config)
-
-        # Execute and verify exception
-        with pytest.raises(InputValidationError) as exc_info:
-            auth_service.signup("test@example.com", "John", "Doe")
-
-        assert "already registered" in str(exc_info.value)
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_signup_with_oauth_existing_email(self, mock_person_service_class, mock_email_service_class,
-                                             mock_login_method_service_class, mock_org_service_class,
-                                             mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test signup when email is already registered with OAuth."""
-        # Setup mocks
-        mock_email_service = mock_email_service_class.return_value
-        existing_email = MagicMock(entity_id="email-123", email="test@example.com")
-        mock_email_service.get_email_by_email_address.return_value = existing_email
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method = MagicMock()
-        mock_login_method.is_oauth_method = True
-        mock_login_method.oauth_provider_name = "google"
-        mock_login_method_service.get_login_method_by_email_id.return_value = mock_login_method
-
-        auth_service = AuthService(mock_config)
+        email_service = auth_service.email_service
+        email_service.get_email_by_email_address.assert_called_once_with("test@example.com")
+        email_service.save_email.assert_called_once()
+        auth_service.person_service.save_person.assert_called_once()
+        auth_service.login_method_service.save_login_method.assert_called_once()
+
+    @pytest.mark.parametrize('login_method, expected_message', [
+        (SimpleNamespace(is_oauth_method=False), "already registered"),
+        (SimpleNamespace(is_oauth_method=True, oauth_provider_name="google"), "already registered with google"),
+    ], ids=['existing_email', 'oauth_email'])
+    def test_signup_with_registered_email(self, auth_service, login_method, expected_message):
+        """Test signup with an email already registered by password or OAuth."""
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': EMAIL_OBJ,
+            'login_method_service.get_login_method_by_email_id': login_method,
+        })
 
         # Execute and verify exception
-        with pytest.raises(InputValidationError) as exc_info:
+        with pytest.raises(InputValidationError, match=expected_message):
             auth_service.signup("test@example.com", "John", "Doe")
 
-        assert "google" in str(exc_info.value).lower()
-
 
 class TestLoginUserByEmailPassword:
     """Tests for login_user_by_email_password method."""
 
-    @patch('common.services.auth.check_password_hash')
-    @patch('common.services.auth.generate_access_token')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_login_success(self, mock_person_service_class, mock_email_service_class,
-                          mock_login_method_service_class, mock_org_service_class,
-                          mock_por_service_class, mock_message_sender_class,
-                          mock_generate_token, mock_check_password, mock_config):
+    def test_login_success(self, auth_service, auth_helpers):
         """Test successful login."""
-        # Setup mocks
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123", email="test@example.com")
-        mock_email_service.get_email_by_email_address.return_value = email_obj
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.is_oauth_method = False
-        login_method.password = "hashed_password"
-        login_method.person_id = "person-123"
-        mock_login_method_service.get_login_method_by_email_id.return_value = login_method
-
-        mock_person_service = mock_person_service_class.return_value
-        person = MagicMock(entity_id="person-123", first_name="John", last_name="Doe")
-        mock_person_service.get_person_by_id.return_value = person
-
-        mock_check_password.return_value = True
-        mock_generate_token.return_value = ("access_token", 1234567890)
-
-        auth_service = AuthService(mock_config)
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': EMAIL_OBJ,
+            'login_method_service.get_login_method_by_email_id': LOGIN_METHOD_OBJ,
+            'person_service.get_person_by_id': PERSON_OBJ,
+        })
 
         # Execute
         token, expiry = auth_service.login_user_by_email_password("test@example.com", "password")  # NOSONAR - Test data
@@ -170,108 +152,34 @@ class TestLoginUserByEmailPassword:
         # Verify
         assert token == "access_token"
         assert expiry == 1234567890
-        mock_check_password.assert_called_once_with("hashed_password", "password")  # NOSONAR - Test data
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_login_email_not_registered(self, mock_person_service_class, mock_email_service_class,
-                                       mock_login_method_service_class, mock_org_service_class,
-                                       mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test login with unregistered email."""
-        mock_email_service = mock_email_service_class.return_value
-        mock_email_service.get_email_by_email_address.return_value = None
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(InputValidationError) as exc_info:
-            auth_service.login_user_by_email_password("test@example.com", "password")  # NOSONAR - Test data
-
-        assert "not registered" in str(exc_info.value)
-
-    @patch('common.services.auth.check_password_hash')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_login_incorrect_password(self, mock_person_service_class, mock_email_service_class,
-                                     mock_login_method_service_class, mock_org_service_class,
-                                     mock_por_service_class, mock_message_sender_class,
-                                     mock_check_password, mock_config):
-        """Test login with incorrect password."""
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123")
-        mock_email_service.get_email_by_email_address.return_value = email_obj
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.is_oauth_method = False
-        login_method.password = "hashed_password"
-        mock_login_method_service.get_login_method_by_email_id.return_value = login_method
-
-        mock_check_password.return_value = False
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(InputValidationError) as exc_info:
+        auth_helpers.check_password_hash.assert_called_once_with("hashed_password", "password")  # NOSONAR - Test data
+
+    @pytest.mark.parametrize('email_obj, login_method, expected_message', [
+        (None, None, "not registered"),
+        (EMAIL_OBJ, None, "Login method not found"),
+        (EMAIL_OBJ, SimpleNamespace(is_oauth_method=True, oauth_provider_name="google"), "created using google"),
+        (EMAIL_OBJ, SimpleNamespace(is_oauth_method=False, password=None), "does not have a password set"),
+        (EMAIL_OBJ, SimpleNamespace(is_oauth_method=False, password="hashed_password"), "Incorrect"),
+    ], ids=['email_not_registered', 'no_login_method', 'oauth_account', 'no_password_set', 'incorrect_password'])
+    def test_login_rejected(self, auth_service, auth_helpers, email_obj, login_method, expected_message):
+        """Test each way email/password login is rejected."""
+        auth_helpers.check_password_hash.return_value = False
+
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': email_obj,
+            'login_method_service.get_login_method_by_email_id': login_method,
+        })
+
+        with pytest.raises(InputValidationError, match=expected_message):
             auth_service.login_user_by_email_password("test@example.com", "wrong_password")  # NOSONAR - Test data
 
-        assert "Incorrect" in str(exc_info.value)
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_login_with_oauth_account(self, mock_person_service_class, mock_email_service_class,
-                                      mock_login_method_service_class, mock_org_service_class,
-                                      mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test login attempt on OAuth account."""
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123")
-        mock_email_service.get_email_by_email_address.return_value = email_obj
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.is_oauth_method = True
-        login_method.oauth_provider_name = "google"
-        mock_login_method_service.get_login_method_by_email_id.return_value = login_method
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(InputValidationError) as exc_info:
-            auth_service.login_user_by_email_password("test@example.com", "password")  # NOSONAR - Test data
-
-        assert "google" in str(exc_info.value).lower()
-
 
 class TestGenerateResetPasswordToken:
     """Tests for generate_reset_password_token method."""
 
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_generate_reset_token(self, mock_person_service_class, mock_email_service_class,
-                                  mock_login_method_service_class, mock_org_service_class,
-                                  mock_por_service_class, mock_message_sender_class, mock_config):
+    def test_generate_reset_token(self, auth_service):
         """Test generating password reset token."""
-        auth_service = AuthService(mock_config)
-
-        login_method = MagicMock()
-        login_method.person_id = "person-123"
-        login_method.email_id = "email-123"
-        login_method.password = "hashed_password"
-
-        token = auth_service.generate_reset_password_token(login_method, "test@example.com")
+        token = auth_service.generate_reset_password_token(LOGIN_METHOD_OBJ, "test@example.com")
 
         assert token is not None
         assert isinstance(token, str)
@@ -289,38 +197,18 @@ class TestParseResetPasswordToken:
 
     def test_parse_valid_token(self):
         """Test parsing a valid reset token."""
-        login_method = MagicMock()
-        login_method.password = "secret_key"
-
-        # Create a valid token
-        payload = {
-            'email': 'test@example.com',
-            'email_id': 'email-123',
-            'person_id': 'person-123',
-            'exp': time.time() + 3600
-        }
-        token = jwt.encode(payload, "secret_key", algorithm='HS256')
+        login_method = SimpleNamespace(password="old_hashed_password")
 
-        result = AuthService.parse_reset_password_token(token, login_method)
+        result = AuthService.parse_reset_password_token(VALID_RESET_TOKEN, login_method)
 
         assert result is not None
         assert result['email'] == 'test@example.com'
 
     def test_parse_expired_token(self):
         """Test parsing an expired token."""
-        login_method = MagicMock()
-        login_method.password = "secret_key"
+        login_method = SimpleNamespace(password="old_hashed_password")
 
-        # Create an expired token
-        payload = {
-            'email': 'test@example.com',
-            'email_id': 'email-123',
-            'person_id': 'person-123',
-            'exp': time.time() - 3600  # Expired
-        }
-        token = jwt.encode(payload, "secret_key", algorithm='HS256')
-
-        result = AuthService.parse_reset_password_token(token, login_method)
+        result = AuthService.parse_reset_password_token(EXPIRED_RESET_TOKEN, login_method)
 
         assert result is None
 
@@ -328,303 +216,174 @@ class TestParseResetPasswordToken:
 class TestLoginUserByOAuth:
     """Tests for login_user_by_oauth method."""
 
-    @patch('common.services.auth.generate_access_token')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_oauth_login_existing_user(self, mock_person_service_class, mock_email_service_class,
-                                      mock_login_method_service_class, mock_org_service_class,
-                                      mock_por_service_class, mock_message_sender_class,
-                                      mock_generate_token, mock_config):
-        """Test OAuth login for existing user."""
-        mock_email_service = mock_email_service_class.return_value
-        existing_email = MagicMock(entity_id="email-123", person_id="person-123", is_verified=True)
-        mock_email_service.get_email_by_email_address.return_value = existing_email
-
-        mock_person_service = mock_person_service_class.return_value
-        person = MagicMock(entity_id="person-123", first_name="John", last_name="Doe")
-        mock_person_service.get_person_by_id.return_value = person
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.is_oauth_method = True
-        mock_login_method_service.get_login_method_by_email_id.return_value = login_method
-
-        mock_generate_token.return_value = ("access_token", 1234567890)
-
-        auth_service = AuthService(mock_config)
-
-        token, expiry, returned_person = auth_service.login_user_by_oauth(
-            "test@example.com", "John", "Doe", "google", {"sub": "123"}
-        )
+    @pytest.mark.parametrize('email_obj, login_method, expected_login_method, saves_login_method, verifies_email', [
+        (VERIFIED_EMAIL_OBJ, OAUTH_LOGIN_METHOD_OBJ, OAUTH_LOGIN_METHOD_OBJ, False, False),
+        (EMAIL_OBJ, OAUTH_LOGIN_METHOD_OBJ, OAUTH_LOGIN_METHOD_OBJ, False, True),
+        (EMAIL_OBJ, None, LOGIN_METHOD_OBJ, True, True),
+    ], ids=['oauth_login_method', 'unverified_email', 'no_login_method'])
+    def test_oauth_login_existing_user(self, auth_service, auth_helpers, email_obj, login_method,
+                                       expected_login_method, saves_login_method, verifies_email):
+        """Test OAuth login for an existing user across login method and verification states."""
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': email_obj,
+            'email_service.verify_email': VERIFIED_EMAIL_OBJ,
+            'person_service.get_person_by_id': PERSON_OBJ,
+            'login_method_service.get_login_method_by_email_id': login_method,
+            'login_method_service.save_login_method': LOGIN_METHOD_OBJ,
+        })
+
+        token, expiry, returned_person = auth_service.login_user_by_oauth(*OAUTH_ARGS)
 
         assert token == "access_token"
         assert expiry == 1234567890
-        assert returned_person == person
-
-    @patch('common.services.auth.generate_access_token')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_oauth_login_new_user(self, mock_person_service_class, mock_email_service_class,
-                                 mock_login_method_service_class, mock_org_service_class,
-                                 mock_por_service_class, mock_message_sender_class,
-                                 mock_generate_token, mock_config):
-        """Test OAuth login for new user creation."""
-        mock_email_service = mock_email_service_class.return_value
-        mock_email_service.get_email_by_email_address.return_value = None
-        mock_email_service.save_email.return_value = MagicMock(entity_id="email-123", email="test@example.com")
+        assert returned_person == PERSON_OBJ
+        assert auth_service.login_method_service.save_login_method.called == saves_login_method
+        assert auth_service.email_service.verify_email.call_args_list == ([call(email_obj)] if verifies_email else [])
+        auth_helpers.generate_access_token.assert_called_once_with(
+            expected_login_method, person=PERSON_OBJ, email=VERIFIED_EMAIL_OBJ
+        )
 
-        mock_person_service = mock_person_service_class.return_value
-        mock_person_service.save_person.return_value = MagicMock(entity_id="person-123", first_name="John", last_name="Doe")
+    def test_oauth_login_converts_password_login_method(self, auth_service, auth_helpers):
+        """Test OAuth login converts an existing password login method to OAuth."""
+        login_method = SimpleNamespace(is_oauth_method=False, method_type="email-password",
+                                       method_data=None, password="hashed_password")
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': VERIFIED_EMAIL_OBJ,
+            'person_service.get_person_by_id': PERSON_OBJ,
+            'login_method_service.get_login_method_by_email_id': login_method,
+        })
+
+        auth_service.login_user_by_oauth(*OAUTH_ARGS)
+
+        auth_service.login_method_service.save_login_method.assert_called_once_with(login_method)
+        assert login_method.method_type == "oauth-google"
+        assert login_method.method_data == OAUTH_ARGS[4]
+        assert login_method.password is None
+        auth_helpers.generate_access_token.assert_called_once_with(
+            login_method, person=PERSON_OBJ, email=VERIFIED_EMAIL_OBJ
+        )
 
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method_service.save_login_method.return_value = MagicMock(entity_id="login-123")
+    def test_oauth_login_new_user(self, auth_service, auth_helpers):
+        """Test OAuth login for new user creation."""
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': None,
+            'email_service.save_email': EMAIL_OBJ,
+            'person_service.save_person': PERSON_OBJ,
+            'login_method_service.save_login_method': LOGIN_METHOD_OBJ,
+        })
 
-        mock_generate_token.return_value = ("access_token", 1234567890)
+        token, expiry, person = auth_service.login_user_by_oauth(*OAUTH_ARGS)
 
-        auth_service = AuthService(mock_config)
+        assert token == "access_token"
+        auth_service.email_service.save_email.assert_called_once()
+        auth_service.person_service.save_person.assert_called_once()
 
-        token, expiry, person = auth_service.login_user_by_oauth(
-            "test@example.com", "John", "Doe", "google", {"sub": "123"}
-        )
+    def test_oauth_login_existing_user_no_person(self, auth_service):
+        """Test OAuth login when person doesn't exist."""
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': EMAIL_OBJ,
+            'person_service.get_person_by_id': None,
+        })
 
-        assert token == "access_token"
-        mock_email_service.save_email.assert_called_once()
-        mock_person_service.save_person.assert_called_once()
+        with pytest.raises(APIException, match="Person not found"):
+            auth_service.login_user_by_oauth(*OAUTH_ARGS)
 
 
 class TestResetUserPassword:
     """Tests for reset_user_password method."""
 
-    @patch('common.services.auth.generate_access_token')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_reset_password_success(self, mock_person_service_class, mock_email_service_class,
-                                    mock_login_method_service_class, mock_org_service_class,
-                                    mock_por_service_class, mock_message_sender_class,
-                                    mock_generate_token, mock_config):
+    def test_reset_password_success(self, auth_service, auth_helpers):
         """Test successful password reset."""
-        from common.helpers.string_utils import urlsafe_base64_encode, force_bytes
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.entity_id = "login-123"
-        login_method.person_id = "person-123"
-        login_method.email_id = "email-123"
-        login_method.password = "old_hashed_password"
-        mock_login_method_service.get_login_method_by_id.return_value = login_method
-        mock_login_method_service.update_password.return_value = login_method
-
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123")
-        mock_email_service.get_email_by_id.return_value = email_obj
-        mock_email_service.verify_email.return_value = email_obj
-
-        mock_person_service = mock_person_service_class.return_value
-        person_obj = MagicMock(entity_id="person-123")
-        mock_person_service.get_person_by_id.return_value = person_obj
-
-        mock_generate_token.return_value = ("new_token", 1234567890)
-
-        auth_service = AuthService(mock_config)
-
-        # Create a valid token
-        payload = {
-            'email': 'test@example.com',
-            'email_id': 'email-123',
-            'person_id': 'person-123',
-            'exp': time.time() + 3600
-        }
-        token = jwt.encode(payload, "old_hashed_password", algorithm='HS256')
-        uidb64 = urlsafe_base64_encode(force_bytes("login-123"))
-
-        access_token, expiry, person = auth_service.reset_user_password(token, uidb64, "NewPassword1!")  # NOSONAR - Test data
-
-        assert access_token == "new_token"
-        assert expiry == 1234567890
-        mock_login_method_service.update_password.assert_called_once()
-        mock_email_service.verify_email.assert_called_once()
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_reset_password_invalid_login_method(self, mock_person_service_class, mock_email_service_class,
-                                                 mock_login_method_service_class, mock_org_service_class,
-                                                 mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test password reset with invalid login method."""
-        from common.helpers.string_utils import urlsafe_base64_encode, force_bytes
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method_service.get_login_method_by_id.return_value = None
-
-        auth_service = AuthService(mock_config)
-
-        uidb64 = urlsafe_base64_encode(force_bytes("invalid-login-id"))
-
-        with pytest.raises(APIException) as exc_info:
-            auth_service.reset_user_password("token", uidb64, "NewPassword1!")  # NOSONAR - Test data
-
-        assert "Invalid password reset URL" in str(exc_info.value)
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_reset_password_invalid_token(self, mock_person_service_class, mock_email_service_class,
-                                          mock_login_method_service_class, mock_org_service_class,
-                                          mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test password reset with invalid token."""
-        from common.helpers.string_utils import urlsafe_base64_encode, force_bytes
+        login_method = SimpleNamespace(entity_id="login-123", person_id="person-123", email_id="email-123",
+                                       password="old_hashed_password")
 
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.entity_id = "login-123"
-        login_method.password = "old_hashed_password"
-        mock_login_method_service.get_login_method_by_id.return_value = login_method
+        _stub(auth_service, {
+            'login_method_service.get_login_method_by_id': login_method,
+            'login_method_service.update_password': login_method,
+            'email_service.get_email_by_id': EMAIL_OBJ,
+            'email_service.verify_email': EMAIL_OBJ,
+            'person_service.get_person_by_id': PERSON_OBJ,
+        })
 
-        auth_service = AuthService(mock_config)
+        access_token, expiry, person = auth_service.reset_user_password(VALID_RESET_TOKEN, UIDB64, "NewPassword1!")  # NOSONAR - Test data
 
-        uidb64 = urlsafe_base64_encode(force_bytes("login-123"))
+        assert access_token == "access_token"
+        assert expiry == 1234567890
+        auth_service.login_method_service.update_password.assert_called_once()
+        auth_service.email_service.verify_email.assert_called_once()
+
+    @pytest.mark.parametrize('token, login_method, email_obj, person, expected_message', [
+        (VALID_RESET_TOKEN, None, EMAIL_OBJ, PERSON_OBJ, "Invalid password reset URL"),
+        (EXPIRED_RESET_TOKEN, SimpleNamespace(password="old_hashed_password"), EMAIL_OBJ, PERSON_OBJ,
+         "Invalid reset password token"),
+        (VALID_RESET_TOKEN, SimpleNamespace(password="old_hashed_password"), None, PERSON_OBJ, "Email not found"),
+        (VALID_RESET_TOKEN, SimpleNamespace(password="old_hashed_password"), EMAIL_OBJ, None,
+         "Person with email not found"),
+    ], ids=['invalid_login_method', 'expired_token', 'email_not_found', 'person_not_found'])
+    def test_reset_password_rejected(self, auth_service, token, login_method, email_obj, person, expected_message):
+        """Test password reset with an unknown login method, expired token, or missing email or person."""
+        _stub(auth_service, {
+            'login_method_service.get_login_method_by_id': login_method,
+            'email_service.get_email_by_id': email_obj,
+            'person_service.get_person_by_id': person,
+        })
+
+        with pytest.raises(APIException, match=expected_message):
+            auth_service.reset_user_password(token, UIDB64, "NewPassword1!")  # NOSONAR - Test data
+
+        auth_service.login_method_service.update_password.assert_not_called()
+
+    def test_reset_password_invalid_token(self, auth_service):
+        """Test password reset with invalid token."""
+        login_method = SimpleNamespace(entity_id="login-123", password="old_hashed_password")
 
-        with pytest.raises(APIException) as exc_info:
-            auth_service.reset_user_password("invalid_token", uidb64, "NewPassword1!")  # NOSONAR - Test data
+        _stub(auth_service, {'login_method_service.get_login_method_by_id': login_method})
 
-        assert "Invalid reset password token" in str(exc_info.value)
+        with pytest.raises(APIException, match="Invalid reset password token"):
+            auth_service.reset_user_password("invalid_token", UIDB64, "NewPassword1!")  # NOSONAR - Test data
 
 
 class TestTriggerForgotPasswordEmail:
     """Tests for trigger_forgot_password_email method."""
 
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_trigger_forgot_password_email_not_registered(self, mock_person_service_class,
-                                                          mock_email_service_class,
-                                                          mock_login_method_service_class,
-                                                          mock_org_service_class,
-                                                          mock_por_service_class,
-                                                          mock_message_sender_class, mock_config):
-        """Test triggering forgot password for unregistered email."""
-        mock_email_service = mock_email_service_class.return_value
-        mock_email_service.get_email_by_email_address.return_value = None
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(APIException) as exc_info:
+    @pytest.mark.parametrize('email_obj, person, expected_message', [
+        (None, None, "not registered"),
+        (EMAIL_OBJ, None, "Person does not exist"),
+    ], ids=['email_not_registered', 'person_not_exist'])
+    def test_trigger_forgot_password_rejected(self, auth_service, email_obj, person, expected_message):
+        """Test triggering forgot password for an unknown email or person."""
+        _stub(auth_service, {
+            'email_service.get_email_by_email_address': email_obj,
+            'person_service.get_person_by_id': person,
+        })
+
+        with pytest.raises(APIException, match=expected_message):
             auth_service.trigger_forgot_password_email("test@example.com")
 
-        assert "not registered" in str(exc_info.value)
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_trigger_forgot_password_person_not_exist(self, mock_person_service_class,
-                                                       mock_email_service_class,
-                                                       mock_login_method_service_class,
-                                                       mock_org_service_class,
-                                                       mock_por_service_class,
-                                                       mock_message_sender_class, mock_config):
-        """Test triggering forgot password when person doesn't exist."""
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123", person_id="person-123", email="test@example.com")
-        mock_email_service.get_email_by_email_address.return_value = email_obj
-
-        mock_person_service = mock_person_service_class.return_value
-        mock_person_service.get_person_by_id.return_value = None
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(APIException) as exc_info:
-            auth_service.trigger_forgot_password_email("test@example.com")
-
-        assert "Person does not exist" in str(exc_info.value)
-
 
 class TestPreparePasswordResetUrl:
     """Tests for prepare_password_reset_url method."""
 
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_prepare_password_reset_url(self, mock_person_service_class, mock_email_service_class,
-                                       mock_login_method_service_class, mock_org_service_class,
-                                       mock_por_service_class, mock_message_sender_class, mock_config):
+    def test_prepare_password_reset_url(self, auth_service):
         """Test preparing password reset URL."""
-        mock_config.VUE_APP_URI = "http://localhost:3000"
-        mock_config.RESET_TOKEN_EXPIRE = "3600"
-
-        auth_service = AuthService(mock_config)
-
-        login_method = MagicMock()
-        login_method.entity_id = "login-123"
-        login_method.person_id = "person-123"
-        login_method.email_id = "email-123"
-        login_method.password = "hashed_password"
+        url = auth_service.prepare_password_reset_url(LOGIN_METHOD_OBJ, "test@example.com")
 
-        url = auth_service.prepare_password_reset_url(login_method, "test@example.com")
-
-        assert url is not None
-        assert url.startswith("http://localhost:3000/set-password/")
-        assert "login-123" in url or "bG9naW4tMTIz" in url  # base64 encoded
+        base, token, uidb64 = url.rsplit("/", 2)
+        assert base == "http://localhost:3000/set-password"
+        assert uidb64 == UIDB64
+        assert auth_service.parse_reset_password_token(token, LOGIN_METHOD_OBJ)['email'] == "test@example.com"
 
 
 class TestSendPasswordResetEmail:
     """Tests for send_password_reset_email method."""
 
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_send_password_reset_email(self, mock_person_service_class, mock_email_service_class,
-                                       mock_login_method_service_class, mock_org_service_class,
-                                       mock_por_service_class, mock_message_sender_class, mock_config):
+    def test_send_password_reset_email(self, auth_service):
         """Test sending password reset email."""
-        mock_config.VUE_APP_URI = "http://localhost:3000"
-        mock_config.RESET_TOKEN_EXPIRE = "3600"
-        mock_config.QUEUE_NAME_PREFIX = "test_"
-        mock_config.EMAIL_SERVICE_PROCESSOR_QUEUE_NAME = "email_queue"
-
-        mock_message_sender = mock_message_sender_class.return_value
-
-        auth_service = AuthService(mock_config)
-
-        login_method = MagicMock()
-        login_method.entity_id = "login-123"
-        login_method.person_id = "person-123"
-        login_method.email_id = "email-123"
-        login_method.password = "hashed_password"
-
-        auth_service.send_password_reset_email("test@example.com", login_method)
+        auth_service.send_password_reset_email("test@example.com", LOGIN_METHOD_OBJ)
 
-        mock_message_sender.send_message.assert_called_once()
-        call_args = mock_message_sender.send_message.call_args[0]
+        send_message = auth_service.message_sender.send_message
+        send_message.assert_called_once()
+        call_args = send_message.call_args[0]
         assert call_args[0] == "test_email_queue"
         assert call_args[1]["event"] == "RESET_PASSWORD"
         assert "test@example.com" in call_args[1]["to_emails"]
@@ -633,209 +392,15 @@ class TestSendPasswordResetEmail:
 class TestSendWelcomeEmail:
     """Tests for send_welcome_email method."""
 
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_send_welcome_email(self, mock_person_service_class, mock_email_service_class,
-                                mock_login_method_service_class, mock_org_service_class,
-                                mock_por_service_class, mock_message_sender_class, mock_config):
+    def test_send_welcome_email(self, auth_service):
         """Test sending welcome email."""
-        mock_config.VUE_APP_URI = "http://localhost:3000"
-        mock_config.RESET_TOKEN_EXPIRE = "3600"
-        mock_config.QUEUE_NAME_PREFIX = "test_"
-        mock_config.EMAIL_SERVICE_PROCESSOR_QUEUE_NAME = "email_queue"
-
-        mock_message_sender = mock_message_sender_class.return_value
-
-        auth_service = AuthService(mock_config)
-
-        login_method = MagicMock()
-        login_method.entity_id = "login-123"
-        login_method.person_id = "person-123"
-        login_method.email_id = "email-123"
-        login_method.password = "hashed_password"
-
-        person = MagicMock()
-        person.first_name = "John"
-        person.last_name = "Doe"
-
-        auth_service.send_welcome_email(login_method, person, "test@example.com")
+        auth_service.send_welcome_email(LOGIN_METHOD_OBJ, PERSON_OBJ, "test@example.com")
 
-        mock_message_sender.send_message.assert_called_once()
-        call_args = mock_message_sender.send_message.call_args[0]
+        send_message = auth_service.message_sender.send_message
+        send_message.assert_called_once()
+        call_args = send_message.call_args[0]
         assert call_args[0] == "test_email_queue"
         assert call_args[1]["event"] == "WELCOME_EMAIL"
         assert "test@example.com" in call_args[1]["to_emails"]
         assert call_args[1]["data"]["recipient_name"] == "John Doe"
 
-
-class TestOAuthLoginEdgeCases:
-    """Tests for OAuth login edge cases."""
-
-    @patch('common.services.auth.generate_access_token')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_oauth_login_existing_user_no_login_method(self, mock_person_service_class,
-                                                       mock_email_service_class,
-                                                       mock_login_method_service_class,
-                                                       mock_org_service_class,
-                                                       mock_por_service_class,
-                                                       mock_message_sender_class,
-                                                       mock_generate_token, mock_config):
-        """Test OAuth login for existing user without login method."""
-        mock_email_service = mock_email_service_class.return_value
-        existing_email = MagicMock(entity_id="email-123", person_id="person-123", is_verified=False)
-        mock_email_service.get_email_by_email_address.return_value = existing_email
-        mock_email_service.verify_email.return_value = existing_email
-
-        mock_person_service = mock_person_service_class.return_value
-        person = MagicMock(entity_id="person-123", first_name="John", last_name="Doe")
-        mock_person_service.get_person_by_id.return_value = person
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method_service.get_login_method_by_email_id.return_value = None
-        mock_login_method_service.save_login_method.return_value = MagicMock(entity_id="login-123")
-
-        mock_generate_token.return_value = ("access_token", 1234567890)
-
-        auth_service = AuthService(mock_config)
-
-        token, expiry, returned_person = auth_service.login_user_by_oauth(
-            "test@example.com", "John", "Doe", "google", {"sub": "123"}
-        )
-
-        assert token == "access_token"
-        assert expiry == 1234567890
-        mock_login_method_service.save_login_method.assert_called_once()
-
-    @patch('common.services.auth.generate_access_token')
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_oauth_login_existing_user_unverified_email(self, mock_person_service_class,
-                                                        mock_email_service_class,
-                                                        mock_login_method_service_class,
-                                                        mock_org_service_class,
-                                                        mock_por_service_class,
-                                                        mock_message_sender_class,
-                                                        mock_generate_token, mock_config):
-        """Test OAuth login verifies unverified email."""
-        mock_email_service = mock_email_service_class.return_value
-        existing_email = MagicMock(entity_id="email-123", person_id="person-123", is_verified=False)
-        mock_email_service.get_email_by_email_address.return_value = existing_email
-        verified_email = MagicMock(entity_id="email-123", person_id="person-123", is_verified=True)
-        mock_email_service.verify_email.return_value = verified_email
-
-        mock_person_service = mock_person_service_class.return_value
-        person = MagicMock(entity_id="person-123", first_name="John", last_name="Doe")
-        mock_person_service.get_person_by_id.return_value = person
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.is_oauth_method = True
-        mock_login_method_service.get_login_method_by_email_id.return_value = login_method
-
-        mock_generate_token.return_value = ("access_token", 1234567890)
-
-        auth_service = AuthService(mock_config)
-
-        token, expiry, returned_person = auth_service.login_user_by_oauth(
-            "test@example.com", "John", "Doe", "google", {"sub": "123"}
-        )
-
-        assert token == "access_token"
-        mock_email_service.verify_email.assert_called_once_with(existing_email)
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_oauth_login_existing_user_no_person(self, mock_person_service_class,
-                                                 mock_email_service_class,
-                                                 mock_login_method_service_class,
-                                                 mock_org_service_class,
-                                                 mock_por_service_class,
-                                                 mock_message_sender_class, mock_config):
-        """Test OAuth login when person doesn't exist."""
-        mock_email_service = mock_email_service_class.return_value
-        existing_email = MagicMock(entity_id="email-123", person_id="person-123")
-        mock_email_service.get_email_by_email_address.return_value = existing_email
-
-        mock_person_service = mock_person_service_class.return_value
-        mock_person_service.get_person_by_id.return_value = None
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(APIException) as exc_info:
-            auth_service.login_user_by_oauth(
-                "test@example.com", "John", "Doe", "google", {"sub": "123"}
-            )
-
-        assert "Person not found" in str(exc_info.value)
-
-
-class TestLoginUserByEmailPasswordEdgeCases:
-    """Tests for login_user_by_email_password edge cases."""
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_login_no_login_method(self, mock_person_service_class, mock_email_service_class,
-                                   mock_login_method_service_class, mock_org_service_class,
-                                   mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test login when no login method exists."""
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123")
-        mock_email_service.get_email_by_email_address.return_value = email_obj
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        mock_login_method_service.get_login_method_by_email_id.return_value = None
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(InputValidationError) as exc_info:
-            auth_service.login_user_by_email_password("test@example.com", "password")  # NOSONAR - Test data
-
-        assert "Login method not found" in str(exc_info.value)
-
-    @patch('common.services.auth.MessageSender')
-    @patch('common.services.auth.PersonOrganizationRoleService')
-    @patch('common.services.auth.OrganizationService')
-    @patch('common.services.auth.LoginMethodService')
-    @patch('common.services.auth.EmailService')
-    @patch('common.services.auth.PersonService')
-    def test_login_no_password_set(self, mock_person_service_class, mock_email_service_class,
-                                   mock_login_method_service_class, mock_org_service_class,
-                                   mock_por_service_class, mock_message_sender_class, mock_config):
-        """Test login when password is not set."""
-        mock_email_service = mock_email_service_class.return_value
-        email_obj = MagicMock(entity_id="email-123")
-        mock_email_service.get_email_by_email_address.return_value = email_obj
-
-        mock_login_method_service = mock_login_method_service_class.return_value
-        login_method = MagicMock()
-        login_method.is_oauth_method = False
-        login_method.password = None
-        mock_login_method_service.get_login_method_by_email_id.return_value = login_method
-
-        auth_service = AuthService(mock_config)
-
-        with pytest.raises(InputValidationError) as exc_info:
-            auth_service.login_user_by_email_password("test@example.com", "password")  # NOSONAR - Test data
-
-        assert "does not have a password set" in str(exc_info.value)
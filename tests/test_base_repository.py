@@ -2,11 +2,17 @@
 Unit tests for common/repositories/base.py
 """
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, patch
 from common.repositories.base import BaseRepository
-from common.models.person import Person
-from rococo.data.postgresql import PostgreSQLAdapter
-from rococo.messaging.base import MessageAdapter
+from common.models import Person, Email, Organization
+
+
+DB_ADAPTER = MagicMock()
+MESSAGE_ADAPTER = MagicMock()
+
+
+class _PersonRepo(BaseRepository):
+    MODEL = Person
 
 
 class TestBaseRepositorySubclassing:
@@ -20,90 +26,34 @@ class TestBaseRepositorySubclassing:
 
         assert "must define the MODEL attribute" in str(exc_info.value)
 
-    def test_subclass_with_model_succeeds(self):
+    @pytest.mark.parametrize('model', [Person, Email, Organization])
+    def test_subclass_with_model_succeeds(self, model):
         """Test that creating a subclass with MODEL attribute succeeds."""
         # Should not raise
         class ValidRepository(BaseRepository):
-            MODEL = Person
+            MODEL = model
 
-        assert ValidRepository.MODEL == Person
+        assert ValidRepository.MODEL == model
 
 
 class TestBaseRepositoryInitialization:
     """Tests for BaseRepository initialization."""
 
-    def test_init_with_all_params(self):
-        """Test initialization with all parameters."""
-        class TestRepository(BaseRepository):
-            MODEL = Person
-
-        db_adapter = MagicMock(spec=PostgreSQLAdapter)
-        message_adapter = MagicMock(spec=MessageAdapter)
-        queue_name = "test-queue"
-        user_id = "user-123"
-
-        repo = TestRepository(
-            db_adapter=db_adapter,
-            message_adapter=message_adapter,
-            queue_name=queue_name,
-            user_id=user_id
-        )
-
-        assert repo is not None
-        assert repo.MODEL == Person
-
-    def test_init_without_user_id(self):
-        """Test initialization without user_id (optional parameter)."""
-        class TestRepository(BaseRepository):
-            MODEL = Person
-
-        db_adapter = MagicMock(spec=PostgreSQLAdapter)
-        message_adapter = MagicMock(spec=MessageAdapter)
-        queue_name = "test-queue"
-
-        repo = TestRepository(
-            db_adapter=db_adapter,
-            message_adapter=message_adapter,
-            queue_name=queue_name
-        )
-
-        assert repo is not None
-
-    def test_init_with_none_message_adapter(self):
-        """Test initialization with None message_adapter."""
-        class TestRepository(BaseRepository):
-            MODEL = Person
-
-        db_adapter = MagicMock(spec=PostgreSQLAdapter)
-        queue_name = "test-queue"
-
-        repo = TestRepository(
-            db_adapter=db_adapter,
-            message_adapter=None,
-            queue_name=queue_name
-        )
-
-        assert repo is not None
-
-    def test_model_passed_to_parent(self):
-        """Test that MODEL is correctly passed to parent class."""
-        class TestRepository(BaseRepository):
-            MODEL = Person
-
-        db_adapter = MagicMock(spec=PostgreSQLAdapter)
-        message_adapter = MagicMock(spec=MessageAdapter)
-        queue_name = "test-queue"
-
-        # Mock the parent __init__ to verify it's called with correct params
+    @pytest.mark.parametrize('message_adapter, user_kwargs, expected_user_id', [
+        (MESSAGE_ADAPTER, {'user_id': "user-123"}, "user-123"),
+        (MESSAGE_ADAPTER, {}, None),
+        (None, {}, None),
+    ], ids=['all_params', 'without_user_id', 'none_message_adapter'])
+    def test_init_passes_arguments_to_parent(self, message_adapter, user_kwargs, expected_user_id):
+        """Test that MODEL and the constructor arguments are passed to the parent class."""
         with patch('rococo.repositories.postgresql.PostgreSQLRepository.__init__', return_value=None) as mock_parent_init:
-            repo = TestRepository(
-                db_adapter=db_adapter,
+            _PersonRepo(
+                db_adapter=DB_ADAPTER,
                 message_adapter=message_adapter,
-                queue_name=queue_name,
-                user_id="test-user"
+                queue_name="test-queue",
+                **user_kwargs
             )
 
-            # Verify parent __init__ was called with MODEL
-            mock_parent_init.assert_called_once_with(
-                db_adapter, Person, message_adapter, queue_name, user_id="test-user"
-            )
+        mock_parent_init.assert_called_once_with(
+            DB_ADAPTER, Person, message_adapter, "test-queue", user_id=expected_user_id
+        )
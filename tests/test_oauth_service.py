@@ -69,10 +69,10 @@ class TestGetGoogleToken:
             client.get_google_token('auth_code', 'http://localhost/callback', 'code_verifier')
 
     @patch('common.services.oauth.requests.post')
-    def test_get_google_token_uses_config_credentials(self, mock_post, mock_config):
+    def test_get_google_token_uses_config_credentials(self, mock_post, mock_config, monkeypatch):
         """Test that get_google_token uses config credentials."""
-        mock_config.GOOGLE_CLIENT_ID = 'test_client_id'
-        mock_config.GOOGLE_CLIENT_SECRET = 'test_client_secret'
+        monkeypatch.setattr(mock_config, 'GOOGLE_CLIENT_ID', 'test_client_id')
+        monkeypatch.setattr(mock_config, 'GOOGLE_CLIENT_SECRET', 'test_client_secret')
 
         mock_response = Mock()
         mock_response.status_code = 200
@@ -185,10 +185,10 @@ class TestGetMicrosoftToken:
             client.get_microsoft_token('invalid_code', 'http://localhost/callback', 'code_verifier')
 
     @patch('common.services.oauth.requests.post')
-    def test_get_microsoft_token_uses_config_credentials(self, mock_post, mock_config):
+    def test_get_microsoft_token_uses_config_credentials(self, mock_post, mock_config, monkeypatch):
         """Test that get_microsoft_token uses config credentials."""
-        mock_config.MICROSOFT_CLIENT_ID = 'ms_client_id'
-        mock_config.MICROSOFT_CLIENT_SECRET = 'ms_client_secret'
+        monkeypatch.setattr(mock_config, 'MICROSOFT_CLIENT_ID', 'ms_client_id')
+        monkeypatch.setattr(mock_config, 'MICROSOFT_CLIENT_SECRET', 'ms_client_secret')
 
         mock_response = Mock()
         mock_response.status_code = 200